@@ -6,6 +6,8 @@ Outputs JSON by default or plain text if requested.
 """
 
 import argparse
+import copy
+import functools
 import json
 import platform
 import socket
@@ -22,6 +24,28 @@ except Exception:
     psutil = None
     HAVE_PSUTIL = False
 
+# orjson is optional; writes the JSON report when installed, stdlib json otherwise
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+def _memoized(fn):
+    """
+    Cache fn's result (platform/psutil/getpass calls aren't free), but give
+    every caller its own deep copy so nobody can edit the cached value.
+    """
+    cached = functools.lru_cache(maxsize=1)(fn)
+
+    @functools.wraps(fn)
+    def wrapper():
+        return copy.deepcopy(cached())
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+@_memoized
 def get_basic_info():
     info = {
         "collected_at": datetime.utcnow().isoformat() + "Z",
@@ -39,8 +63,10 @@ def get_basic_info():
     }
     return info
 
+@_memoized
 def get_network_info():
     nets = []
+    seen_addrs = set()  # dedup index, so membership checks stay O(1)
     # Attempt to get interface-level addresses via psutil if available
     if HAVE_PSUTIL:
         try:
@@ -48,6 +74,7 @@ def get_network_info():
                 for a in addrs:
                     # only include IPv4 and IPv6
                     if a.family.name.startswith("AF_INET") or a.family.name.startswith("AF_INET6"):
+                        seen_addrs.add(a.address)
                         nets.append({
                             "interface": ifname,
                             "address": a.address,
@@ -63,7 +90,8 @@ def get_network_info():
         host_info = socket.gethostbyname_ex(hostname)
         # host_info = (hostname, aliaslist, ipaddrlist)
         for ip in host_info[2]:
-            if not any(n.get("address") == ip for n in nets):
+            if ip not in seen_addrs:
+                seen_addrs.add(ip)
                 nets.append({"interface": "hostname_lookup", "address": ip})
     except Exception:
         pass
@@ -74,13 +102,15 @@ def get_network_info():
             # doesn't have to be reachable — we won't send data
             s.connect(("8.8.8.8", 80))
             outbound_ip = s.getsockname()[0]
-            if not any(n.get("address") == outbound_ip for n in nets):
+            if outbound_ip not in seen_addrs:
+                seen_addrs.add(outbound_ip)
                 nets.append({"interface": "outbound", "address": outbound_ip})
     except Exception:
         pass
 
     return nets
 
+@_memoized
 def get_memory_info():
     if HAVE_PSUTIL:
         vm = psutil.virtual_memory()
@@ -98,11 +128,28 @@ def get_memory_info():
         }
 
 def collect_all():
+    # each getter returns a fresh copy of its memoized result, safe to extend
     out = get_basic_info()
     out["network"] = get_network_info()
     out["memory"] = get_memory_info()
     return out
 
+def _clear_caches():
+    """Drop memoized results so the next collect_all() re-reads the system."""
+    get_basic_info.cache_clear()
+    get_network_info.cache_clear()
+    get_memory_info.cache_clear()
+
+collect_all.cache_clear = _clear_caches
+
+def save_json(data, path):
+    if HAVE_ORJSON:
+        with open(path, "wb") as fh:
+            fh.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+
 def main():
     parser = argparse.ArgumentParser(description="Collect system information (OS, IPs, user, CPU, memory).")
     parser.add_argument("--output", "-o", default="sample_sysinfo.json",
@@ -114,8 +161,7 @@ def main():
     data = collect_all()
 
     # Write JSON file
-    with open(args.output, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
+    save_json(data, args.output)
 
     if args.text:
         # print readable summary
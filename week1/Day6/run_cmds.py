@@ -27,24 +27,43 @@ commands = [
 timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 log_path = os.path.join("logs", f"command_log_{timestamp}.txt")
 
+# Launch everything up front so wall time is the slowest command, not the sum
+procs = []
+for cmd in commands:
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        procs.append((cmd, proc, None))
+    except Exception as e:
+        procs.append((cmd, None, e))
+
 with open(log_path, "w") as log_file:
     log_file.write(f"Command Run Log — {timestamp}\n")
     log_file.write("=" * 60 + "\n\n")
 
-    for cmd in commands:
+    # Harvest in the original order so the log reads the same as before
+    for cmd, proc, launch_error in procs:
         log_file.write(f"Command: {' '.join(cmd)}\n")
         log_file.write("-" * 60 + "\n")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True
-            )
-
-            log_file.write("STDOUT:\n" + result.stdout + "\n")
-            log_file.write("STDERR:\n" + result.stderr + "\n")
-            log_file.write(f"Return Code: {result.returncode}\n")
+            if launch_error:
+                raise launch_error
+
+            try:
+                stdout, stderr = proc.communicate(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                stdout, stderr = proc.communicate()
+                stderr += "\n[killed after 10s timeout]"
+
+            log_file.write("STDOUT:\n" + stdout + "\n")
+            log_file.write("STDERR:\n" + stderr + "\n")
+            log_file.write(f"Return Code: {proc.returncode}\n")
             log_file.write("=" * 60 + "\n\n")
 
         except Exception as e:
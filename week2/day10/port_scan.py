@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 port_scan.py
-Simple TCP port scanner using socket + ThreadPoolExecutor.
+Simple TCP port scanner using asyncio (one thread, many in-flight connects).
 
 Usage:
   python port_scan.py --host 192.168.1.10 --ports 1-1024 --timeout 0.5 --workers 100 --banner
@@ -12,10 +12,45 @@ Examples:
 """
 
 import argparse
+import asyncio
+import errno
+import selectors
 import socket
+import sys
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+
+# uvloop is optional; it's a faster drop-in event loop if installed
+try:
+    import uvloop
+    HAVE_UVLOOP = True
+except Exception:
+    HAVE_UVLOOP = False
+
+# orjson is optional; encodes the results file and the stdout dump, which grow
+# with the port range (stdlib json otherwise)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+# Linux: create sockets already non-blocking (saves an fcntl per socket) and let
+# TCP_USER_TIMEOUT bound the kernel's SYN retransmits to our timeout
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0) if sys.platform.startswith("linux") else 0
+_TCP_USER_TIMEOUT = getattr(socket, "TCP_USER_TIMEOUT", None) if sys.platform.startswith("linux") else None
+
+# connect_ex() codes that mean "non-blocking connect started, wait for writability"
+_CONNECT_PENDING = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+# plain select() (Windows' default selector) takes at most 512 sockets per call
+_SELECT_MAX_FDS = 512
 
 def parse_ports(ports_arg):
     """
@@ -36,65 +71,209 @@ def parse_ports(ports_arg):
             ports.add(int(part))
     return sorted(p for p in ports if 1 <= p <= 65535)
 
-def scan_port(host, port, timeout=0.5, do_banner=False):
-    result = {"port": port, "open": False, "banner": None, "error": None}
+def resolve_target(host):
+    """
+    Resolve host once, up front, so the per-port connects don't each trigger a
+    DNS lookup. Prefers IPv4. Returns (family, ip); raises socket.gaierror.
+    """
+    infos = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    infos.sort(key=lambda info: info[0] != socket.AF_INET)
+    family, _, _, _, sockaddr = infos[0]
+    return family, sockaddr[0]
+
+def _set_user_timeout(s, timeout):
+    if _TCP_USER_TIMEOUT is not None:
+        try:
+            s.setsockopt(socket.IPPROTO_TCP, _TCP_USER_TIMEOUT, max(1, int(timeout * 1000)))
+        except OSError:
+            pass
+
+def max_inflight(requested):
+    """Cap the number of simultaneously open sockets below the process fd limit."""
+    if resource is None:
+        return max(1, requested)
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            res = s.connect_ex((host, port))
-            if res == 0:
-                result["open"] = True
-                if do_banner:
-                    try:
-                        # try to receive small banner
-                        s.settimeout(1.0)
-                        # send a short probe for some services (HTTP newline)
-                        try:
-                            s.sendall(b"\r\n")
-                        except Exception:
-                            pass
-                        banner = s.recv(1024)
-                        if banner:
-                            try:
-                                result["banner"] = banner.decode(errors="ignore").strip()
-                            except Exception:
-                                result["banner"] = repr(banner)
-                    except Exception as be:
-                        result["banner"] = f"<banner error: {be}>"
-            # else closed
-    except Exception as e:
-        result["error"] = str(e)
-    return result
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except Exception:
+        return max(1, requested)
+    if soft == resource.RLIM_INFINITY:
+        return max(1, requested)
+    return max(1, min(requested, soft - 64))
 
-def run_scan(host, ports, timeout=0.5, workers=100, do_banner=False):
-    start = datetime.utcnow().isoformat() + "Z"
+def scan_ports_select(host, ports, timeout=0.5, window=1000, family=socket.AF_INET):
+    """
+    Connect-only scan on a single thread: keep up to `window` non-blocking
+    connects in flight on one selector (epoll/kqueue/select) and check
+    SO_ERROR once each socket becomes writable. Pass an already-resolved IP.
+    Returns a list of (port, open, banner, error) tuples.
+    """
     results = []
-    with ThreadPoolExecutor(max_workers=workers) as ex:
-        futures = {ex.submit(scan_port, host, p, timeout, do_banner): p for p in ports}
-        for fut in as_completed(futures):
+    todo = iter(ports)
+    inflight = {}  # sock -> (port, deadline); insertion order == deadline order
+    sel = selectors.DefaultSelector()
+    if isinstance(sel, selectors.SelectSelector):
+        window = min(window, _SELECT_MAX_FDS)
+
+    def launch():
+        while len(inflight) < window:
+            port = next(todo, None)
+            if port is None:
+                return
+            s = socket.socket(family, socket.SOCK_STREAM | _SOCK_NONBLOCK)
             try:
-                r = fut.result()
+                if not _SOCK_NONBLOCK:
+                    s.setblocking(False)
+                _set_user_timeout(s, timeout)
+                res = s.connect_ex((host, port))
             except Exception as e:
-                r = {"port": futures[fut], "open": False, "banner": None, "error": str(e)}
-            results.append(r)
-    end = datetime.utcnow().isoformat() + "Z"
+                s.close()
+                results.append((port, False, None, str(e)))
+                continue
+            if res in _CONNECT_PENDING:
+                sel.register(s, selectors.EVENT_WRITE)
+                inflight[s] = (port, time.monotonic() + timeout)
+            else:
+                # refused straight away
+                s.close()
+                results.append((port, False, None, None))
+
+    def retire(s, is_open):
+        sel.unregister(s)
+        port, _ = inflight.pop(s)
+        s.close()
+        results.append((port, is_open, None, None))
+
+    try:
+        launch()
+        while inflight:
+            now = time.monotonic()
+            first_deadline = next(iter(inflight.values()))[1]
+            for key, _ in sel.select(max(0.0, first_deadline - now)):
+                s = key.fileobj
+                retire(s, s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0)
+            # anything past its deadline is filtered/closed
+            now = time.monotonic()
+            expired = []
+            for s, (port, deadline) in inflight.items():
+                if deadline > now:
+                    break
+                expired.append(s)
+            for s in expired:
+                retire(s, False)
+            launch()
+    finally:
+        for s in list(inflight):
+            sel.unregister(s)
+            s.close()
+        sel.close()
+    return results
+
+async def scan_port_async(host, port, timeout=0.5, do_banner=False):
+    """Async connect (and optional banner grab) for one port; returns a (port, open, banner, error) tuple."""
+    banner_text = None
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except socket.gaierror as e:
+        return (port, False, None, str(e))
+    except (asyncio.TimeoutError, OSError):
+        # closed / filtered (same as a non-zero connect_ex)
+        return (port, False, None, None)
+    except Exception as e:
+        return (port, False, None, str(e))
+
+    try:
+        if do_banner:
+            # send a short probe for some services (HTTP newline)
+            try:
+                writer.write(b"\r\n")
+                await writer.drain()
+            except Exception:
+                pass
+            try:
+                # try to receive small banner
+                banner = await asyncio.wait_for(reader.read(1024), 1.0)
+                if banner:
+                    banner_text = banner.decode(errors="ignore").strip()
+            except asyncio.TimeoutError:
+                banner_text = "<banner error: timed out>"
+            except Exception as be:
+                banner_text = f"<banner error: {be}>"
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+    return (port, True, banner_text, None)
+
+async def _scan_all(host, ports, timeout, concurrency, do_banner):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(port):
+        async with sem:
+            return await scan_port_async(host, port, timeout, do_banner)
+
+    tasks = [asyncio.create_task(bounded(p)) for p in ports]
+    results = []
+    for port, r in zip(ports, await asyncio.gather(*tasks, return_exceptions=True)):
+        if isinstance(r, Exception):
+            r = (port, False, None, str(r))
+        results.append(r)
+    return results
+
+def run_async(coro):
+    """Run a coroutine on uvloop if available, else the stdlib event loop."""
+    if HAVE_UVLOOP and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def run_scan(host, ports, timeout=0.5, workers=100, do_banner=False):
+    # one wall-clock read; the end time is derived from a monotonic delta
+    start_dt = datetime.utcnow()
+    t0 = time.perf_counter()
+    # each "worker" is worth ~10 in-flight connects now that nothing blocks a thread
+    concurrency = max_inflight(workers * 10)
+    # one DNS lookup for the whole scan; workers connect straight to the IP
+    try:
+        family, target_ip = resolve_target(host)
+    except socket.gaierror as e:
+        target_ip = None
+        results = [(p, False, None, str(e)) for p in ports]
+    else:
+        if do_banner:
+            results = run_async(_scan_all(target_ip, ports, timeout, concurrency, do_banner))
+        else:
+            # plain connect scan: raw non-blocking sockets, no per-port task objects
+            results = scan_ports_select(target_ip, ports, timeout, window=concurrency, family=family)
+    end_dt = start_dt + timedelta(seconds=time.perf_counter() - t0)
     summary = {
         "host": host,
+        "ip": target_ip,
         "ports_scanned_count": len(ports),
         "timeout_sec": timeout,
         "workers": workers,
-        "scanned_at": start,
-        "completed_at": end,
-        "results": sorted(results, key=lambda x: x["port"])
+        "scanned_at": start_dt.isoformat() + "Z",
+        "completed_at": end_dt.isoformat() + "Z",
+        # closed ports carry no information, so only open/errored ones become dicts
+        "results": [{"port": p, "open": o, "banner": b, "error": e}
+                    for p, o, b, e in sorted(results) if o or e]
     }
     return summary
 
+def save_json(data, path):
+    if HAVE_ORJSON:
+        with open(path, "wb") as fh:
+            fh.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+
 def main():
-    p = argparse.ArgumentParser(description="Simple threaded TCP port scanner.")
+    p = argparse.ArgumentParser(description="Simple asyncio TCP port scanner.")
     p.add_argument("--host", "-t", required=True, help="Target host (IP or hostname)")
     p.add_argument("--ports", "-p", help="Ports: '1-100' or '22,80,443' (default 1-100)")
     p.add_argument("--timeout", type=float, default=0.5, help="Socket timeout (seconds)")
-    p.add_argument("--workers", type=int, default=100, help="Concurrent worker threads")
+    p.add_argument("--workers", type=int, default=100, help="Concurrency (x10 in-flight connects)")
     p.add_argument("--banner", action="store_true", help="Attempt to grab a small banner from open ports")
     p.add_argument("--output", "-o", default=None, help="Write JSON results to file (optional)")
     args = p.parse_args()
@@ -115,13 +294,15 @@ def main():
         print("No open ports found in the scanned range.")
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as fh:
-            json.dump(summary, fh, indent=2)
+        save_json(summary, args.output)
         print(f"Results written to {args.output}")
     else:
         # print JSON summary to stdout
         print("\nJSON summary:")
-        print(json.dumps(summary, indent=2))
+        if HAVE_ORJSON:
+            print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(summary, indent=2))
 
 if __name__ == "__main__":
     main()
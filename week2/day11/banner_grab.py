@@ -14,14 +14,32 @@ example.com:22
 """
 
 import argparse
+import functools
 import socket
 import json
 import ssl
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson is optional; encodes the bulk results file (stdlib json otherwise)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 HTTP_PORTS = {80, 8080, 8000, 443, 8443}
+TLS_PORTS = {443, 8443}
+HTTP_PROBE_TEMPLATE = b"HEAD / HTTP/1.1\r\nHost: %s\r\nConnection: close\r\n\r\n"
+
+# Building a context loads the CA bundle, so do it once; wrap_socket is thread-safe
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = True
+
+# (host, port) -> ssl.SSLSession, so repeat visits can resume instead of a full handshake.
+# Plain dict get/set is atomic under the GIL, which is all the workers need.
+_TLS_SESSIONS = {}
 
 def try_banner(host, port, timeout=2.0, http_probe=True, use_ssl=False):
     """
@@ -30,6 +48,7 @@ def try_banner(host, port, timeout=2.0, http_probe=True, use_ssl=False):
     use_ssl forces wrapping the socket with TLS (useful for 443/8443).
     Returns dict with keys: host, port, success, banner, error, elapsed.
     """
+    do_http = http_probe and port in HTTP_PORTS
     out = {
         "host": host,
         "port": port,
@@ -37,9 +56,9 @@ def try_banner(host, port, timeout=2.0, http_probe=True, use_ssl=False):
         "banner": None,
         "error": None,
         "elapsed_ms": None,
-        "probing": "http" if (http_probe and port in HTTP_PORTS) else "tcp"
+        "probing": "http" if do_http else "tcp"
     }
-    start = time.time()
+    start = time.perf_counter()
     s = None
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -49,19 +68,18 @@ def try_banner(host, port, timeout=2.0, http_probe=True, use_ssl=False):
         s.connect((host, port))
 
         # Optionally wrap in SSL (useful for HTTPS)
-        if use_ssl or port in (443, 8443):
+        if use_ssl or port in TLS_PORTS:
             try:
-                context = ssl.create_default_context()
-                s = context.wrap_socket(s, server_hostname=host)
+                s = _SSL_CTX.wrap_socket(s, server_hostname=host,
+                                         session=_TLS_SESSIONS.get((host, port)))
             except Exception as e:
                 # SSL wrapping failed; continue as plain socket (note the error)
                 out["error"] = f"ssl_wrap_error: {e}"
 
         # If HTTP probe is appropriate, send a minimal request
-        if http_probe and port in HTTP_PORTS:
+        if do_http:
             try:
-                req = f"HEAD / HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n"
-                s.sendall(req.encode())
+                s.sendall(HTTP_PROBE_TEMPLATE % host.encode("idna"))
             except Exception:
                 # It's okay if send fails; we'll still try to recv banner
                 pass
@@ -86,12 +104,18 @@ def try_banner(host, port, timeout=2.0, http_probe=True, use_ssl=False):
     except Exception as e:
         out["error"] = f"connect_error: {e}"
     finally:
+        if isinstance(s, ssl.SSLSocket):
+            try:
+                if s.session is not None:
+                    _TLS_SESSIONS[(host, port)] = s.session
+            except Exception:
+                pass
         if s:
             try:
                 s.close()
             except Exception:
                 pass
-        out["elapsed_ms"] = int((time.time() - start) * 1000)
+        out["elapsed_ms"] = int((time.perf_counter() - start) * 1000)
     return out
 
 def parse_ports(ports_arg):
@@ -130,19 +154,30 @@ def build_targets_from_args(host, ports_list):
         targets.append((host, p))
     return targets
 
+def _try_target(target, timeout=2.0, http_probe=True, ssl_force=False):
+    # exceptions must not escape, or ex.map() would abort the whole batch
+    host, port = target
+    try:
+        return try_banner(host, port, timeout, http_probe, ssl_force)
+    except Exception as e:
+        return {"host": host, "port": port, "success": False, "banner": None, "error": f"exception:{e}", "elapsed_ms": None}
+
 def run_bulk(targets, timeout=2.0, workers=50, http_probe=True, ssl_force=False):
-    results = []
+    fn = functools.partial(_try_target, timeout=timeout, http_probe=http_probe, ssl_force=ssl_force)
     with ThreadPoolExecutor(max_workers=workers) as ex:
-        futures = {ex.submit(try_banner, t[0], t[1], timeout, http_probe, ssl_force): t for t in targets}
-        for fut in as_completed(futures):
-            try:
-                r = fut.result()
-            except Exception as e:
-                host, port = futures[fut]
-                r = {"host": host, "port": port, "success": False, "banner": None, "error": f"exception:{e}", "elapsed_ms": None}
-            results.append(r)
+        # map() skips the futures dict and as_completed() waiter bookkeeping;
+        # results come back in target order
+        results = list(ex.map(fn, targets))
     return results
 
+def save_json(data, path):
+    if HAVE_ORJSON:
+        with open(path, "wb") as fh:
+            fh.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+
 def main():
     p = argparse.ArgumentParser(description="Banner grabber - collect banners/headers from host:port pairs")
     p.add_argument("--host", help="Single host (use with --ports)")
@@ -175,8 +210,7 @@ def main():
         "count": len(results),
         "results": results
     }
-    with open(args.output, "w", encoding="utf-8") as fh:
-        json.dump(out, fh, indent=2)
+    save_json(out, args.output)
     print(f"Done. Results written to {args.output}")
 
 if __name__ == "__main__":
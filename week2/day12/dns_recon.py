@@ -10,23 +10,57 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import select
 import socket
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+QTYPES = ("A", "MX", "NS", "TXT")
+
 # Try to import dnspython
 try:
+    import dns.flags
+    import dns.message
+    import dns.name
+    import dns.rdataclass
+    import dns.rcode
+    import dns.rdatatype
     import dns.resolver
     HAVE_DNSPY = True
 except Exception:
     HAVE_DNSPY = False
 
+@functools.lru_cache(maxsize=16)
+def get_resolver(nameserver=None):
+    """
+    Shared Resolver per nameserver (None = system default). Building one parses
+    /etc/resolv.conf, so do it once; the LRU answer cache lets repeated
+    domains skip the network.
+    """
+    resolver = dns.resolver.Resolver()
+    if nameserver:
+        resolver.nameservers = [nameserver]
+    resolver.cache = dns.resolver.LRUCache(1000)
+    return resolver
+
+_DEFAULT_RESOLVER = None
+if HAVE_DNSPY:
+    try:
+        _DEFAULT_RESOLVER = get_resolver()
+    except Exception:
+        # e.g. no resolv.conf; run_dns_recon will report it per call
+        pass
+
 def query_with_dnspython(domain, qtype, resolver=None, lifetime=3.0):
     """Query using dnspython and return list of strings (or empty list)."""
     answers = []
     try:
-        res = dns.resolver.resolve(domain, qtype, lifetime=lifetime, resolver=resolver)
+        res = (resolver or dns.resolver).resolve(domain, qtype, lifetime=lifetime)
         for r in res:
             answers.append(r.to_text())
     except Exception as e:
@@ -34,6 +68,102 @@ def query_with_dnspython(domain, qtype, resolver=None, lifetime=3.0):
         return [], str(e)
     return answers, None
 
+def query_batch_udp(queries, nameserver, timeout=3.0, max_inflight=256, resolver=None):
+    """
+    Send many (domain, qtype) queries to one nameserver over a single UDP socket.
+    At most max_inflight queries are outstanding at once (to stay under server
+    rate limits); replies are matched back by message id. UDP can drop a
+    datagram, so unanswered queries are resent every timeout/3 until their
+    deadline, like Resolver.resolve retrying within its lifetime.
+    Truncated replies are retried through `resolver` (which falls back to TCP).
+    Answers are read from / stored in the resolver's cache when it has one.
+    Returns {(domain, qtype): (answers, error)} like query_with_dnspython.
+    """
+    results = {}
+    todo = deque(queries)
+    pending = {}  # message id -> ((domain, qtype), query, wire, deadline, next resend)
+    resend_every = timeout / 3
+    family = socket.AF_INET6 if ":" in nameserver else socket.AF_INET
+    retry_tcp = []
+    cache = getattr(resolver, "cache", None)
+
+    def cache_key(key):
+        return (dns.name.from_text(key[0]), dns.rdatatype.from_text(key[1]), dns.rdataclass.IN)
+
+    with socket.socket(family, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        while todo or pending:
+            # top up the in-flight window
+            while todo and len(pending) < max_inflight:
+                key = todo.popleft()
+                try:
+                    cached = cache.get(cache_key(key)) if cache is not None else None
+                    if cached is not None:
+                        results[key] = ([rd.to_text() for rd in cached], None)
+                        continue
+                    q = dns.message.make_query(key[0], key[1])
+                    while q.id in pending:
+                        q = dns.message.make_query(key[0], key[1])
+                    wire = q.to_wire()
+                    sock.sendto(wire, (nameserver, 53))
+                except Exception as e:
+                    results[key] = ([], str(e))
+                    continue
+                now = time.monotonic()
+                pending[q.id] = (key, q, wire, now + timeout, now + resend_every)
+            if not pending:
+                break
+
+            wait = min(min(d, r) for _, _, _, d, r in pending.values()) - time.monotonic()
+            readable, _, _ = select.select([sock], [], [], max(0.0, wait))
+            while readable:
+                try:
+                    wire, _ = sock.recvfrom(65535)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    # e.g. ICMP port unreachable surfaced on the socket
+                    break
+                try:
+                    r = dns.message.from_wire(wire)
+                except Exception:
+                    continue
+                entry = pending.get(r.id)
+                if entry is None or not entry[1].is_response(r):
+                    continue
+                del pending[r.id]
+                key, q = entry[0], entry[1]
+                if r.flags & dns.flags.TC:
+                    retry_tcp.append(key)
+                elif r.rcode() != dns.rcode.NOERROR:
+                    results[key] = ([], dns.rcode.to_text(r.rcode()))
+                else:
+                    rdtype = dns.rdatatype.from_text(key[1])
+                    answers = [rd.to_text() for rrset in r.answer if rrset.rdtype == rdtype for rd in rrset]
+                    results[key] = (answers, None) if answers else ([], f"no {key[1]} records in response")
+                    if answers and cache is not None:
+                        try:
+                            qname = q.question[0].name
+                            cache.put(cache_key(key), dns.resolver.Answer(qname, rdtype, dns.rdataclass.IN, r))
+                        except Exception:
+                            pass
+
+            now = time.monotonic()
+            for qid, (key, q, wire, deadline, resend_at) in list(pending.items()):
+                if deadline <= now:
+                    del pending[qid]
+                    results[key] = ([], f"timeout after {timeout}s")
+                elif resend_at <= now:
+                    try:
+                        sock.sendto(wire, (nameserver, 53))
+                    except OSError:
+                        pass
+                    pending[qid] = (key, q, wire, deadline, now + resend_every)
+
+    for key in retry_tcp:
+        results[key] = query_with_dnspython(key[0], key[1], resolver=resolver, lifetime=timeout)
+    return results
+
 def query_a_fallback(domain):
     """Fallback to socket.getaddrinfo for A/AAAA addresses."""
     addrs = []
@@ -62,20 +192,32 @@ def run_dns_recon(domain, nameserver=None, timeout=3.0):
         "errors": {}
     }
 
-    # Setup resolver if dnspython is available and nameserver provided
+    # Reuse the cached resolver for this nameserver (timeouts are passed per query)
     resolver = None
     if HAVE_DNSPY:
         try:
-            resolver = dns.resolver.Resolver()
-            resolver.lifetime = timeout
-            if nameserver:
-                resolver.nameservers = [nameserver]
+            resolver = get_resolver(nameserver) if nameserver else (_DEFAULT_RESOLVER or get_resolver())
         except Exception as e:
             out["errors"]["resolver_setup"] = str(e)
 
+    # The four lookups are independent, so run them concurrently (wall time ~ slowest one).
+    # With an explicit --nameserver they all go out on one UDP socket. The system
+    # default goes through Resolver.resolve on threads, which keeps its retries,
+    # failover across every configured nameserver and search list.
+    answers = {}
+    if HAVE_DNSPY:
+        if nameserver:
+            batch = query_batch_udp([(domain, qt) for qt in QTYPES], nameserver, timeout, resolver=resolver)
+            answers = {qt: batch[(domain, qt)] for qt in QTYPES}
+        else:
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                futures = {qt: ex.submit(query_with_dnspython, domain, qt, resolver, timeout)
+                           for qt in QTYPES}
+            answers = {qt: fut.result() for qt, fut in futures.items()}
+
     # A records
     if HAVE_DNSPY:
-        res, err = query_with_dnspython(domain, "A", resolver=resolver, lifetime=timeout)
+        res, err = answers["A"]
         if err:
             # fallback to socket
             out["errors"]["A_dnspython"] = err
@@ -93,7 +235,7 @@ def run_dns_recon(domain, nameserver=None, timeout=3.0):
 
     # MX records
     if HAVE_DNSPY:
-        mx, err = query_with_dnspython(domain, "MX", resolver=resolver, lifetime=timeout)
+        mx, err = answers["MX"]
         if err:
             out["errors"]["MX"] = err
             out["results"]["MX"] = []
@@ -119,7 +261,7 @@ def run_dns_recon(domain, nameserver=None, timeout=3.0):
 
     # NS records
     if HAVE_DNSPY:
-        ns, err = query_with_dnspython(domain, "NS", resolver=resolver, lifetime=timeout)
+        ns, err = answers["NS"]
         if err:
             out["errors"]["NS"] = err
             out["results"]["NS"] = []
@@ -132,7 +274,7 @@ def run_dns_recon(domain, nameserver=None, timeout=3.0):
 
     # TXT records
     if HAVE_DNSPY:
-        txt, err = query_with_dnspython(domain, "TXT", resolver=resolver, lifetime=timeout)
+        txt, err = answers["TXT"]
         if err:
             out["errors"]["TXT"] = err
             out["results"]["TXT"] = []
@@ -2,12 +2,19 @@
 """
 scapy_examples.py — craft and parse a packet locally (DO NOT send)
 """
+import struct
+
 from scapy.all import IP, TCP, Raw
 
 
 # 1. Craft an IP/TCP packet (layers are stacked left-to-right)
 packet = IP(dst="10.0.0.5", src="10.0.0.10")/TCP(sport=4444, dport=80, flags="S")/Raw(b"Hello-Scapy")
 
+# Build it once and re-dissect the bytes: lengths and checksums are now fixed
+# fields, so show()/bytes()/field access below don't recompute them every time
+raw = bytes(packet)
+packet = packet.__class__(raw)
+
 
 # 2. Show a summary (one-line)
 print("SUMMARY:")
@@ -30,10 +37,31 @@ print("Payload raw bytes:", bytes(packet[Raw].load))
 
 
 # 5. Demonstrate parsing from raw bytes (simulate receiving)
-raw = bytes(packet)
 print("\nPARSE FROM RAW BYTES:")
 parsed = IP(raw)
 parsed.show()
 
 
+# 6. Templated generation: patch fields in the already-built bytes instead of
+#    rebuilding the packet (here: bump the TCP source port)
+def csum_replace16(csum, old, new):
+    """RFC 1624 incremental checksum update when one 16-bit word changes."""
+    s = (~csum & 0xFFFF) + (~old & 0xFFFF) + new
+    s = (s & 0xFFFF) + (s >> 16)
+    s = (s & 0xFFFF) + (s >> 16)
+    return ~s & 0xFFFF
+
+template = bytearray(raw)
+tcp_off = packet[IP].ihl * 4
+sport_off, chksum_off = tcp_off, tcp_off + 16  # offsets inside the TCP header
+
+print("\nTEMPLATED PACKETS (sport patched in place):")
+for sport in (4445, 4446, 4447):
+    old_sport, = struct.unpack_from("!H", template, sport_off)
+    old_chksum, = struct.unpack_from("!H", template, chksum_off)
+    struct.pack_into("!H", template, sport_off, sport)
+    struct.pack_into("!H", template, chksum_off, csum_replace16(old_chksum, old_sport, sport))
+    print(IP(bytes(template)).summary(), "chksum:", hex(struct.unpack_from("!H", template, chksum_off)[0]))
+
+
 # Note: This script never calls send() or sr() — it only constructs and parses locally.
\ No newline at end of file
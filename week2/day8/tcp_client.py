@@ -1,51 +1,79 @@
+import functools
 import socket
 import sys
 import logging
+from logging.handlers import RotatingFileHandler
 
-# Setup logging
+# Setup logging (delay=True: the log file is only opened on the first record)
 logging.basicConfig(
-    filename='tcp_client.log',
+    handlers=[RotatingFileHandler('tcp_client.log', maxBytes=1 << 20,
+                                  backupCount=3, delay=True)],
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-def tcp_client(host, port, message):
-    try:
-        # 1️⃣ Create a socket (AF_INET = IPv4, SOCK_STREAM = TCP)
-        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        logging.info(f"Socket created for {host}:{port}")
+@functools.lru_cache(maxsize=256)
+def resolve(host, port):
+    """getaddrinfo, cached: repeat calls to the same target skip the DNS lookup."""
+    return tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
 
-        # 2️⃣ Set timeout (avoid waiting forever)
-        client.settimeout(5)
-        logging.info("Timeout set to 5 seconds")
+def open_connection(host, port, timeout=5):
+    """
+    Connect to the first resolved address that answers (IPv4 or IPv6), like
+    socket.create_connection but reusing the cached lookup.
+    """
+    last_error = None
+    for family, socktype, proto, _, sockaddr in resolve(host, port):
+        client = None
+        try:
+            # creation can fail too (e.g. an AAAA result on a host without IPv6)
+            client = socket.socket(family, socktype, proto)
+            logging.info("Socket created for %s:%s (%s)", host, port, sockaddr[0])
+            # Single request/response: don't let Nagle + delayed ACK hold the send back
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.settimeout(timeout)
+            client.connect(sockaddr)
+            return client
+        except OSError as e:
+            if client:
+                client.close()
+            last_error = e
+    raise last_error or socket.error(f"No addresses found for {host}")
 
-        # 3️⃣ Connect to target
-        client.connect((host, port))
-        logging.info(f"Connected to {host}:{port}")
+def tcp_client(host, port, message):
+    client = None
+    try:
+        # 1️⃣ Resolve (cached), create a socket for that address family,
+        # 2️⃣ set a timeout (avoid waiting forever) and 3️⃣ connect to target
+        client = open_connection(host, port, timeout=5)
+        logging.info("Connected to %s:%s", host, port)
 
-        # 4️⃣ Send data
-        client.sendall(message.encode())
-        logging.info(f"Sent message: {message}")
+        # 4️⃣ Send data (str or bytes; bytes go out as-is)
+        payload = message if isinstance(message, (bytes, bytearray)) else message.encode()
+        client.sendall(payload)
+        logging.info("Sent message: %s", message)
 
-        # 5️⃣ Receive response
+        # 5️⃣ Receive response (decoded once for both the log and the print)
         response = client.recv(4096)
-        logging.info(f"Received response: {response.decode(errors='ignore')}")
+        decoded = response.decode(errors='ignore')
+        logging.info("Received response: %s", decoded)
 
-        print("Response from server:", response.decode(errors='ignore'))
+        print("Response from server:", decoded)
 
     except socket.timeout:
         logging.error("Connection timed out.")
         print("❌ Connection timed out.")
     except socket.error as e:
-        logging.error(f"Socket error: {e}")
+        logging.error("Socket error: %s", e)
         print(f"❌ Socket error: {e}")
     except Exception as e:
-        logging.critical(f"Unexpected error: {e}")
+        logging.critical("Unexpected error: %s", e)
         print(f"❌ Unexpected error: {e}")
     finally:
         # 6️⃣ Always close the connection
-        client.close()
-        logging.info("Connection closed.")
+        if client:
+            client.close()
+            logging.info("Connection closed.")
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
@@ -7,27 +7,242 @@ Usage:
   python ping_sweeper.py --subnet 192.168.1 --mode icmp --timeout 1 --delay 0.05 --workers 50
 
 Modes:
-  - icmp : use system ping (recommended; no root required usually)
+  - icmp : ICMP echo from one shared socket (unprivileged ICMP socket or raw
+           socket as root); falls back to one `fping` run, then to system ping
+           per host, if neither is allowed
   - tcp  : try TCP connect to specified port (useful if ICMP blocked)
 
+Optional: orjson (faster JSON output), uvloop (faster event loop where the
+asyncio TCP path is used), aiodns (concurrent PTR lookups for --resolve-names).
+
 Output:
   Writes results to results_<subnet>_<mode>.json
+  (or results_<subnet>_<mode>.ndjson, one result per line, with --output-format ndjson)
 """
 
 import argparse
+import asyncio
+import errno
+import functools
+import heapq
+import os
 import platform
+import select
+import shutil
 import subprocess
 import socket
 import json
+import struct
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson is optional; encodes the summary file and each NDJSON line, one record
+# per host (stdlib json otherwise)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+# uvloop is optional; it's a faster drop-in event loop for the asyncio TCP path
+try:
+    import uvloop
+    HAVE_UVLOOP = True
+except Exception:
+    HAVE_UVLOOP = False
+
+# aiodns is optional; lets all PTR lookups share one event loop and resolver
+try:
+    import aiodns
+    HAVE_AIODNS = True
+except Exception:
+    HAVE_AIODNS = False
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_PAYLOAD = b"ping_sweeper-py!"
+
+def icmp_checksum(data):
+    """16-bit one's-complement checksum (RFC 1071)."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total & 0xFFFF) + (total >> 16)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def csum_replace16(csum, old, new):
+    """RFC 1624 incremental checksum update when one 16-bit word changes."""
+    s = (~csum & 0xFFFF) + (~old & 0xFFFF) + new
+    s = (s & 0xFFFF) + (s >> 16)
+    s = (s & 0xFFFF) + (s >> 16)
+    return ~s & 0xFFFF
+
+class IcmpPinger:
+    """
+    Send ICMP echo requests from one shared socket instead of forking `ping`
+    per host. Tries an unprivileged ICMP datagram socket first (Linux, see
+    net.ipv4.ping_group_range), then a raw socket (root/admin).
+    Raises OSError if neither is permitted.
+
+    Replies are matched back by sequence number, so many echoes can be
+    outstanding on the one socket. Sweeps on a shared pinger run one at a time.
+    """
+
+    def __init__(self):
+        try:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+            self.raw = False
+        except OSError:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            self.raw = True
+        self.sock.setblocking(False)
+        self.ident = os.getpid() & 0xFFFF
+        self._seq = 0
+        self._lock = threading.Lock()  # one sweep at a time owns the socket
+        # one echo packet, reused: only seq and checksum change per send
+        self._echo = bytearray(struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, self.ident, 0) + ICMP_PAYLOAD)
+        struct.pack_into("!H", self._echo, 2, icmp_checksum(bytes(self._echo)))
+
+    def close(self):
+        self.sock.close()
+
+    def _next_seq(self):
+        self._seq = (self._seq + 1) & 0xFFFF
+        return self._seq
+
+    def send_echo(self, seq, ip):
+        """Patch seq into the echo template (checksum updated in O(1)) and send it."""
+        echo = self._echo
+        checksum, old_seq = struct.unpack_from("!H2xH", echo, 2)
+        struct.pack_into("!H", echo, 2, csum_replace16(checksum, old_seq, seq))
+        struct.pack_into("!H", echo, 6, seq)
+        self.sock.sendto(echo, (ip, 0))
+
+    def _read_replies(self, wait):
+        """Wait up to `wait` seconds, then return (seq, addr) for every echo reply read."""
+        got = []
+        readable, _, _ = select.select([self.sock], [], [], wait)
+        while readable:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            # raw sockets (and macOS datagram sockets) include the IPv4 header;
+            # an echo reply itself starts with type 0, so the version nibble tells them apart
+            with_ip_header = bool(data) and data[0] >> 4 == 4
+            if with_ip_header:
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8:
+                continue
+            icmp_type, _, _, ident, seq = struct.unpack("!BBHHH", data[:8])
+            # Linux datagram sockets get a kernel-assigned ident (and are already
+            # filtered); anywhere the header comes through, our ident is kept
+            if icmp_type != ICMP_ECHO_REPLY or (with_ip_header and ident != self.ident):
+                continue
+            got.append((seq, addr[0]))
+        return got
+
+    def sweep(self, ips, timeout=1.0, burst=None, delay=0.0):
+        """
+        Fan-out: send an echo to every IP back-to-back, then read replies off the
+        one socket until everyone has answered or `timeout` has passed since the
+        last send. Optional pacing: after every `burst` sends, spend `delay`
+        seconds reading replies before sending more.
+        Returns {ip: alive}.
+        """
+        with self._lock:
+            return self._sweep(ips, timeout, burst, delay)
+
+    def _sweep(self, ips, timeout, burst, delay):
+        alive = dict.fromkeys(ips, False)
+        seq_to_ip = {}  # only echoes still waiting for a reply
+
+        def collect(until, stop_when_done=True):
+            while (seq_to_ip or not stop_when_done) and time.monotonic() < until:
+                for seq, addr in self._read_replies(max(0.0, until - time.monotonic())):
+                    if seq_to_ip.get(seq) == addr:
+                        alive[addr] = True
+                        del seq_to_ip[seq]
+
+        for n, ip in enumerate(ips, 1):
+            seq = self._next_seq()
+            try:
+                self.send_echo(seq, ip)
+                seq_to_ip[seq] = ip
+            except OSError:
+                pass
+            if burst and delay and n % burst == 0:
+                collect(time.monotonic() + delay, stop_when_done=False)
+        collect(time.monotonic() + timeout)
+        return alive
+
+_PINGER = None
+_PINGER_LOCK = threading.Lock()
+
+def get_pinger():
+    """Shared IcmpPinger, or None if ICMP sockets aren't permitted here."""
+    global _PINGER
+    with _PINGER_LOCK:
+        if _PINGER is None:
+            try:
+                _PINGER = IcmpPinger()
+            except OSError:
+                _PINGER = False
+        return _PINGER or None
+
+def icmp_sweep(ips, timeout=1, burst=None, delay=0.0):
+    """
+    Ping every IP from one socket in a single send-all/collect pass.
+    Total time is about one RTT plus timeout rather than N x RTT / workers.
+    Returns {ip: alive}, or None if ICMP sockets aren't permitted here.
+    """
+    pinger = get_pinger()
+    if pinger is None:
+        return None
+    return pinger.sweep(ips, timeout=timeout, burst=burst, delay=delay)
+
+def ping_sweep_fping(ips, timeout=1, burst=None, delay=0.0):
+    """
+    Ping every IP with a single `fping` process instead of one `ping` per host.
+    Returns {ip: alive}, or None if fping isn't installed or fails to run.
+    """
+    fping = shutil.which("fping")
+    if not fping:
+        return None
+    # -a: print only live hosts, -r 0: one echo per host like `ping -c 1`
+    cmd = [fping, "-a", "-r", "0", "-t", str(max(1, int(timeout * 1000)))]
+    if burst and delay:
+        # keep the same politeness budget: `burst` echoes per `delay`
+        cmd += ["-i", str(max(1, int(delay * 1000 / burst)))]
+    try:
+        res = subprocess.run(cmd + list(ips), capture_output=True, text=True)
+    except OSError:
+        return None
+    # exit status 1 just means some hosts were unreachable; >1 is a real error
+    if res.returncode > 1:
+        return None
+    live = {line.split()[0] for line in res.stdout.splitlines() if line.strip()}
+    return {ip: ip in live for ip in ips}
+
 def ping_icmp(host, timeout=1):
     """
-    Use system ping. Cross-platform handling for basic options.
+    ICMP echo via the shared socket; falls back to system ping (one process per
+    host) when ICMP sockets aren't permitted. Cross-platform handling for basic options.
     Returns True if host replies, False otherwise.
     """
+    pinger = get_pinger()
+    if pinger is not None:
+        # replies come back from the numeric address, so match on that
+        try:
+            ip = socket.gethostbyname(host)
+        except OSError:
+            ip = None
+        if ip:
+            return pinger.sweep([ip], timeout=timeout)[ip]
+
     system = platform.system().lower()
     if system == "windows":
         # -n count, -w timeout(ms)
@@ -43,52 +258,305 @@ def ping_icmp(host, timeout=1):
     except Exception:
         return False
 
-def tcp_probe(host, port=80, timeout=1):
+async def tcp_probe_async(host, port=80, timeout=1):
     """
-    Try a TCP connect to host:port. Returns True if connect succeeded.
+    Async TCP connect to host:port. Returns True if connect succeeded.
     """
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            s.connect((host, port))
-            return True
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
     except Exception:
         return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except Exception:
+        pass
+    return True
+
+async def _sweep_tcp_async(ips, tcp_port=80, timeout=1, delay=0.0, workers=100):
+    """TCP mode: every connect multiplexed on one event loop, `workers` in flight."""
+    sem = asyncio.Semaphore(workers)
+    limiter = _RateLimiter(delay / workers) if delay else None
+
+    async def probe(ip):
+        async with sem:
+            if limiter:
+                await limiter.acquire_async()
+            ok = await tcp_probe_async(ip, port=tcp_port, timeout=timeout)
+        return {"ip": ip, "alive": ok, "method": "tcp", "port": tcp_port}
+
+    return await asyncio.gather(*(probe(ip) for ip in ips))
+
+def run_async(coro):
+    """Run a coroutine on uvloop if available, else the stdlib event loop."""
+    if HAVE_UVLOOP and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
-def scan_ip(ip, mode="icmp", tcp_port=80, timeout=1, delay=0.0):
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+_SOCK_STREAM_NB = socket.SOCK_STREAM | _SOCK_NONBLOCK | getattr(socket, "SOCK_CLOEXEC", 0)
+
+def scan_tcp_epoll(ips, port=80, timeout=1, window=100, delay=0.0):
     """
-    Scan single IP with specified mode.
-    Returns dict: {"ip": ip, "alive": True/False, "method": mode}
+    TCP mode without threads or tasks: non-blocking connect() to each IP, every
+    fd on one epoll, SO_ERROR read once it turns writable. Up to `window`
+    connects are in flight; a finished probe's slot is held for `delay` seconds
+    (the same politeness as the per-worker sleep). Linux only (select.epoll).
+    Returns a bytearray alive map in the same order as `ips` (1 = connected):
+    probes are tracked by index, so no per-IP dicts are built in the loop.
     """
-    result = {"ip": ip, "alive": False, "method": mode}
-    if mode == "icmp":
-        ok = ping_icmp(ip, timeout=timeout)
-        result["alive"] = ok
-    else:
-        ok = tcp_probe(ip, port=tcp_port, timeout=timeout)
-        result["alive"] = ok
-        result["port"] = tcp_port
-    if delay:
-        # small polite delay
-        time.sleep(delay)
-    return result
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    targets = [(ip, port) for ip in ips]
+    alive = bytearray(len(targets))
+    next_i = 0
+    ep = select.epoll()
+    inflight = {}   # fd -> (sock, index)
+    deadlines = []  # min-heap of (deadline, index, fd)
+    cooling = []    # min-heap of slot release times
 
-def sweep(subnet_prefix, mode="icmp", tcp_port=80, timeout=1, delay=0.02, workers=100):
+    def finish(fd, ok):
+        s, i = inflight.pop(fd)
+        ep.unregister(fd)
+        s.close()
+        alive[i] = ok
+        if delay:
+            heapq.heappush(cooling, time.monotonic() + delay)
+
+    try:
+        while next_i < len(targets) or inflight:
+            now = time.monotonic()
+            while cooling and cooling[0] <= now:
+                heapq.heappop(cooling)
+            while next_i < len(targets) and len(inflight) + len(cooling) < window:
+                i = next_i
+                next_i += 1
+                try:
+                    # flags fused into the socket() call: no separate fcntl()s
+                    s = socket.socket(socket.AF_INET, _SOCK_STREAM_NB)
+                    if not _SOCK_NONBLOCK:
+                        s.setblocking(False)
+                    err = s.connect_ex(targets[i])
+                except OSError:
+                    continue
+                if err not in (0, errno.EINPROGRESS):
+                    s.close()
+                    continue
+                fd = s.fileno()
+                ep.register(fd, select.EPOLLOUT | select.EPOLLERR)
+                inflight[fd] = (s, i)
+                heapq.heappush(deadlines, (now + timeout, i, fd))
+
+            wakeups = []
+            if deadlines:
+                wakeups.append(deadlines[0][0])
+            if next_i < len(targets) and cooling:
+                wakeups.append(cooling[0])
+            if not wakeups:
+                # nothing in flight and nothing can start: don't spin
+                break
+            for fd, _ in ep.poll(max(0.0, min(wakeups) - time.monotonic())):
+                s = inflight[fd][0]
+                finish(fd, s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0)
+
+            # expire probes past their deadline (skip heap entries for fds already done)
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                _, i, fd = heapq.heappop(deadlines)
+                if fd in inflight and inflight[fd][1] == i:
+                    finish(fd, False)
+    finally:
+        for s, _ in inflight.values():
+            s.close()
+        ep.close()
+    return alive
+
+class _RateLimiter:
+    """
+    Shared pacing for probes: hands out start slots `interval` seconds apart.
+    A worker only waits when it's ahead of schedule, instead of every worker
+    sleeping after every probe.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Claim the next slot; returns how many seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+            return slot - now
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+def scan_ip(ip, timeout=1, limiter=None):
+    """
+    ICMP-check a single IP (the per-host path, used only when neither ICMP
+    sockets nor fping are available; TCP mode never needs a thread per host).
+    Returns dict: {"ip": ip, "alive": True/False, "method": "icmp"}
+    """
+    if limiter:
+        limiter.acquire()
+    return {"ip": ip, "alive": ping_icmp(ip, timeout=timeout), "method": "icmp"}
+
+@functools.lru_cache(maxsize=1024)
+def ptr(ip):
+    """Reverse DNS name for ip, or None. Cached, so each IP is looked up once."""
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except (OSError, UnicodeError):
+        return None
+
+async def _ptr_async(ips):
+    resolver = aiodns.DNSResolver()
+
+    async def lookup(ip):
+        try:
+            return (await resolver.gethostbyaddr(ip)).name
+        except Exception:
+            return None
+
+    return await asyncio.gather(*(lookup(ip) for ip in ips))
+
+def reverse_lookup(ips, workers=32):
+    """
+    PTR names for many IPs at once: {ip: name or None}. With aiodns every query
+    is in flight together on one loop; otherwise the cached ptr() runs on a
+    small thread pool.
+    """
+    ips = list(dict.fromkeys(ips))
+    if not ips:
+        return {}
+    if HAVE_AIODNS:
+        try:
+            return dict(zip(ips, run_async(_ptr_async(ips))))
+        except Exception:
+            pass
+    with ThreadPoolExecutor(max_workers=min(workers, len(ips))) as ex:
+        return dict(zip(ips, ex.map(ptr, ips)))
+
+def _try_scan_ip(ip, timeout=1, limiter=None):
+    # exceptions must not escape, or ex.map() would abort the whole sweep
+    try:
+        return scan_ip(ip, timeout, limiter)
+    except Exception as e:
+        return {"ip": ip, "alive": False, "error": str(e)}
+
+def parse_subnet_prefix(subnet_prefix):
+    """
+    Parse 'a.b.c' once into its packed 3-byte form (raises ValueError if it
+    isn't a valid /24 prefix).
+    """
+    # inet_pton is strict where inet_aton isn't ("010", "0x7f", trailing junk);
+    # the round-trip also rejects anything that isn't plain dotted decimal
+    addr = subnet_prefix + ".0"
+    try:
+        packed = socket.inet_pton(socket.AF_INET, addr)
+        if socket.inet_ntop(socket.AF_INET, packed) == addr:
+            return packed[:3]
+    except (OSError, TypeError):
+        pass
+    raise ValueError(f"not a /24 prefix like 192.168.1: {subnet_prefix!r}")
+
+def subnet_hosts(subnet_prefix):
+    """
+    .1-.254 of the /24, built from the packed prefix plus one host byte rather
+    than re-formatting the prefix text for every address.
+    """
+    prefix = parse_subnet_prefix(subnet_prefix)
+    return [socket.inet_ntoa(prefix + bytes((i,))) for i in range(1, 255)]
+
+def auto_workers(mode, n_targets):
+    """
+    Pick a concurrency level instead of a fixed 100. Past a point, more threads
+    only add context switches and GIL contention: forked `ping` processes are
+    CPU-bound, so that path is capped near the core count. Socket probes are
+    just fds waiting on the network, so they can all be in flight at once.
+    """
+    if mode == "icmp" and get_pinger() is None and not shutil.which("fping"):
+        return min(n_targets, max(8, (os.cpu_count() or 1) * 4))
+    return n_targets
+
+def sweep(subnet_prefix, mode="icmp", tcp_port=80, timeout=1, delay=0.02, workers=100, auto=False, sink=None,
+          only_alive=False, resolve_names=False):
     """
     Sweep x.x.x.0/24 (subnet_prefix example: '192.168.1')
     Returns list of result dicts for each IP scanned.
+    `workers` is capped at the number of targets; auto=True picks it per mode.
+    While scanning, liveness is kept as one byte per host (indexed by the last
+    octet); the result dicts are only built once the sweep is done.
+    If `sink` is given, each result dict is passed to it instead of being kept,
+    and the summary's "results" is None.
+    only_alive=True drops dead hosts before they're kept or passed to `sink`.
+    resolve_names=True adds a "hostname" (PTR) to live hosts, looked up in one batch.
     """
-    ips = [f"{subnet_prefix}.{i}" for i in range(1, 255)]  # skip .0 and .255 usually
-    results = []
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    ips = subnet_hosts(subnet_prefix)  # skip .0 and .255 usually
+    workers = auto_workers(mode, len(ips)) if auto else min(workers, len(ips))
+    alive = bytearray(256)  # alive[n] == 1 if <prefix>.n answered
+    errors = {}             # last octet -> error text (thread-pool path only)
     start = datetime.utcnow().isoformat() + "Z"
-    with ThreadPoolExecutor(max_workers=workers) as ex:
-        futures = {ex.submit(scan_ip, ip, mode, tcp_port, timeout, delay): ip for ip in ips}
-        for fut in as_completed(futures):
-            try:
-                r = fut.result()
-            except Exception as e:
-                r = {"ip": futures[fut], "alive": False, "error": str(e)}
-            results.append(r)
+    icmp_alive = None
+    if mode == "icmp":
+        # every echo goes out on one socket, replies collected in one pass;
+        # without ICMP sockets, one fping process still beats 254 pings
+        icmp_alive = icmp_sweep(ips, timeout, burst=workers, delay=delay)
+        if icmp_alive is None:
+            icmp_alive = ping_sweep_fping(ips, timeout, burst=workers, delay=delay)
+    if icmp_alive is not None:
+        for n, ip in enumerate(ips, 1):
+            alive[n] = icmp_alive[ip]
+    elif mode == "tcp" and hasattr(select, "epoll"):
+        # raw non-blocking connects on one epoll: no threads, no task objects
+        alive[1:255] = scan_tcp_epoll(ips, tcp_port, timeout, window=workers, delay=delay)
+    elif mode == "tcp":
+        # one event loop instead of a thread per blocking connect
+        for n, r in enumerate(run_async(_sweep_tcp_async(ips, tcp_port, timeout, delay, workers)), 1):
+            alive[n] = r["alive"]
+    else:
+        # ICMP one process per host (no ICMP sockets, no fping);
+        # same politeness budget as before (at most `workers` probes per `delay`),
+        # without parking a worker thread in sleep() after every probe
+        limiter = _RateLimiter(delay / workers) if delay else None
+        fn = functools.partial(_try_scan_ip, timeout=timeout, limiter=limiter)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            # map() skips the futures dict and as_completed() waiter bookkeeping,
+            # and yields results in address order
+            for n, r in enumerate(ex.map(fn, ips), 1):
+                alive[n] = r["alive"]
+                if "error" in r:
+                    errors[n] = r["error"]
+
+    names = {}
+    if resolve_names:
+        names = reverse_lookup([ip for n, ip in enumerate(ips, 1) if alive[n]])
+    results = []
+    emit = results.append if sink is None else sink
+    for n, ip in enumerate(ips, 1):
+        if only_alive and not alive[n]:
+            continue
+        if n in errors:
+            emit({"ip": ip, "alive": False, "error": errors[n]})
+            continue
+        r = {"ip": ip, "alive": bool(alive[n]), "method": mode}
+        if mode == "tcp":
+            r["port"] = tcp_port
+        if alive[n] and resolve_names:
+            r["hostname"] = names[ip]
+        emit(r)
     end = datetime.utcnow().isoformat() + "Z"
     summary = {
         "subnet": f"{subnet_prefix}.0/24",
@@ -97,17 +565,25 @@ def sweep(subnet_prefix, mode="icmp", tcp_port=80, timeout=1, delay=0.02, worker
         "timeout_sec": timeout,
         "delay_sec": delay,
         "workers": workers,
+        "only_alive": only_alive,
         "scanned_at": start,
         "completed_at": end,
-        "results": results
+        "results": results if sink is None else None
     }
     return summary
 
+def results_filename(subnet, mode, ext="json"):
+    return f"results_{subnet.replace('/', '_')}_{mode}.{ext}"
+
 def save_results(summary, filename=None):
     if not filename:
-        filename = f"results_{summary['subnet'].replace('/', '_')}_{summary['mode']}.json"
-    with open(filename, "w", encoding="utf-8") as fh:
-        json.dump(summary, fh, indent=2)
+        filename = results_filename(summary["subnet"], summary["mode"])
+    if HAVE_ORJSON:
+        with open(filename, "wb") as fh:
+            fh.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
     return filename
 
 def parse_args():
@@ -116,19 +592,49 @@ def parse_args():
     p.add_argument("--mode", choices=["icmp", "tcp"], default="icmp", help="Scan mode (icmp or tcp)")
     p.add_argument("--tcp-port", type=int, default=80, help="TCP port to probe when using tcp mode")
     p.add_argument("--timeout", type=float, default=1.0, help="Timeout per probe in seconds")
-    p.add_argument("--delay", type=float, default=0.02, help="Delay after each probe (seconds) to be polite")
+    p.add_argument("--delay", type=float, default=0.02, help="Politeness pacing (seconds): at most --workers probes start per delay")
     p.add_argument("--workers", type=int, default=100, help="Number of concurrent threads")
-    return p.parse_args()
+    p.add_argument("--auto-workers", action="store_true", help="Pick the concurrency per mode instead of --workers")
+    p.add_argument("--only-alive", action="store_true", help="Only write results for hosts that responded")
+    p.add_argument("--resolve-names", action="store_true", help="Look up reverse DNS (PTR) names for live hosts")
+    p.add_argument("--output-format", choices=["json", "ndjson"], default="json",
+                   help="json: one summary document; ndjson: one result per line, none kept in memory")
+    args = p.parse_args()
+    try:
+        parse_subnet_prefix(args.subnet)
+    except ValueError as e:
+        p.error(str(e))
+    if args.workers < 1:
+        p.error("--workers must be at least 1")
+    return args
 
 if __name__ == "__main__":
     args = parse_args()
-    print(f"Starting sweep: {args.subnet}.0/24  mode={args.mode} workers={args.workers}")
-    summary = sweep(args.subnet, mode=args.mode, tcp_port=args.tcp_port,
-                    timeout=args.timeout, delay=args.delay, workers=args.workers)
-    out_file = save_results(summary)
-    alive_hosts = [r["ip"] for r in summary["results"] if r.get("alive")]
+    print(f"Starting sweep: {args.subnet}.0/24  mode={args.mode} workers={'auto' if args.auto_workers else args.workers}")
+    sweep_kwargs = dict(mode=args.mode, tcp_port=args.tcp_port, timeout=args.timeout,
+                        delay=args.delay, workers=args.workers, auto=args.auto_workers,
+                        only_alive=args.only_alive, resolve_names=args.resolve_names)
+    if args.output_format == "ndjson":
+        # write each result straight to disk; only live IPs are kept for the report
+        out_file = results_filename(f"{args.subnet}.0/24", args.mode, "ndjson")
+        alive_hosts = []
+        with open(out_file, "wb") as fh:
+            def write_result(r):
+                if HAVE_ORJSON:
+                    fh.write(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    fh.write((json.dumps(r) + "\n").encode("utf-8"))
+                if r.get("alive"):
+                    alive_hosts.append(r["ip"])
+            summary = sweep(args.subnet, sink=write_result, **sweep_kwargs)
+    else:
+        summary = sweep(args.subnet, **sweep_kwargs)
+        out_file = save_results(summary)
+        alive_hosts = [r["ip"] for r in summary["results"] if r.get("alive")]
+    print(f"Effective workers: {summary['workers']}")
     print(f"Done. Found {len(alive_hosts)} live hosts. Results saved to {out_file}")
     if alive_hosts:
         print("Live hosts:")
-        for h in alive_hosts:
+        # packed 4-byte keys sort in numeric address order (.2 before .10)
+        for h in sorted(alive_hosts, key=socket.inet_aton):
             print(" -", h)